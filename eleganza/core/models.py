@@ -9,10 +9,12 @@ class SoftDeleteQuerySet(models.QuerySet):
     def delete(self):
         """Soft delete - set deleted_at timestamp"""
         return self.update(deleted_at=timezone.now())
+    delete.queryset_only = True  # Keep bulk deletes off the managers, as Django does
 
     def hard_delete(self):
         """Permanent deletion"""
         return super().delete()
+    hard_delete.queryset_only = True
 
     def alive(self):
         """Return only non-deleted items"""
@@ -22,21 +24,23 @@ class SoftDeleteQuerySet(models.QuerySet):
         """Return only deleted items"""
         return self.filter(deleted_at__isnull=False)
 
-class SoftDeleteManager(models.Manager):
-    """Custom manager supporting soft delete filtering"""
-    def __init__(self, *args, **kwargs):
-        self.alive_only = kwargs.pop('alive_only', True)
-        super().__init__(*args, **kwargs)
-
-    def get_queryset(self):
-        if self.alive_only:
-            return SoftDeleteQuerySet(self.model).filter(deleted_at__isnull=True)
-        return SoftDeleteQuerySet(self.model)
-
+class AllObjectsManager(models.Manager.from_queryset(SoftDeleteQuerySet)):
+    """Manager over every row, soft-deleted or not"""
     def hard_delete(self):
         """Bypass soft delete for manager operations"""
         return self.get_queryset().hard_delete()
 
+class SoftDeleteManager(AllObjectsManager):
+    """Custom manager exposing only non-deleted rows"""
+    def get_queryset(self):
+        # Reuse the base manager construction so routing hints and
+        # SoftDeleteQuerySet methods are proxied as usual
+        return super().get_queryset().alive()
+
+    def dead(self):
+        """Soft-deleted rows, which get_queryset() filters out"""
+        return super().get_queryset().dead()
+
 class SoftDeleteModel(models.Model):
     """
     Abstract model providing soft delete functionality
@@ -50,7 +54,7 @@ class SoftDeleteModel(models.Model):
     )
 
     objects = SoftDeleteManager()
-    all_objects = SoftDeleteManager(alive_only=False)
+    all_objects = AllObjectsManager()
 
     class Meta:
         abstract = True
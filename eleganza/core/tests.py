@@ -1,3 +1,29 @@
-from django.test import TestCase
+import pytest
 
-# Create your tests here.
+from eleganza.core.validators import IMAGE_SIGNATURES
+from eleganza.core.validators import SNIFF_LENGTH
+from eleganza.core.validators import sniff_image_format
+
+
+@pytest.mark.parametrize(
+    ("header", "expected"),
+    [
+        (b"\xff\xd8\xff\xe0\x00\x10JFIF\x00\x01", "JPEG"),
+        (b"\x89PNG\r\n\x1a\n\x00\x00\x00\rIHDR", "PNG"),
+        (b"RIFF\x24\x00\x00\x00WEBPVP8 ", "WEBP"),
+        (b"RIFF\x24\x00\x00\x00WAVEfmt ", None),  # RIFF, but not a WebP
+        (b"GIF89a\x01\x00\x01\x00", None),
+        (b"%PDF-1.7\n", None),
+        (b"\xff\xd8", None),  # Truncated JPEG marker
+        (b"RIFF", None),  # Too short to reach the WEBP tag
+        (b"", None),
+    ],
+)
+def test_sniff_image_format(header, expected):
+    assert sniff_image_format(header) == expected
+
+
+def test_sniff_length_covers_every_signature():
+    for parts in IMAGE_SIGNATURES.values():
+        for offset, magic in parts:
+            assert offset + len(magic) <= SNIFF_LENGTH
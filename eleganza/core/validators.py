@@ -3,7 +3,6 @@ import uuid
 from django.core.exceptions import ValidationError
 from django.core.validators import FileExtensionValidator
 from django.utils.translation import gettext_lazy as _
-from PIL import Image
 
 class ImageTypeConfig:
     """
@@ -22,6 +21,23 @@ class ImageTypeConfig:
     VALID_CONTENT_TYPES = ['JPEG', 'PNG', 'WEBP']  # Matches PIL format names
     MAX_DIMENSION = 4000
 
+# Magic numbers keyed by PIL format name: (offset, expected bytes) pairs
+IMAGE_SIGNATURES = {
+    'JPEG': ((0, b'\xff\xd8\xff'),),
+    'PNG': ((0, b'\x89PNG\r\n\x1a\n'),),
+    'WEBP': ((0, b'RIFF'), (8, b'WEBP')),
+}
+SNIFF_LENGTH = 16
+
+def sniff_image_format(header: bytes):
+    """
+    Identify an image format from its leading bytes without decoding it.
+    """
+    for image_format, parts in IMAGE_SIGNATURES.items():
+        if all(header[offset:offset + len(magic)] == magic for offset, magic in parts):
+            return image_format
+    return None
+
 class BaseImageValidator(FileExtensionValidator):
     """
     Generic image validator that can be configured for different use cases.
@@ -44,10 +60,28 @@ class BaseImageValidator(FileExtensionValidator):
         
         # Validate file extension
         super().__call__(value)
+
+        # Check the actual bytes, not the name, before handing the file to Pillow
+        value.seek(0)
+        sniffed_format = sniff_image_format(value.read(SNIFF_LENGTH))
+        value.seek(0)
+        if sniffed_format not in self.config.VALID_CONTENT_TYPES:
+            raise ValidationError(
+                _("Invalid image format: %(format)s. Allowed: %(allowed)s"),
+                code="invalid_format",
+                params={
+                    'format': sniffed_format or _("unknown"),
+                    'allowed': ', '.join(self.config.VALID_CONTENT_TYPES)
+                }
+            )
         
+        # Imported here so processes that never validate images don't load Pillow
+        from PIL import Image
+
         try:
-            # First image opening: check format and verify integrity
             value.seek(0)  # Ensure pointer is at start
+            # Image.open only parses the header, so the format and dimensions
+            # are checked before verify() reads any pixel data
             with Image.open(value) as img:
                 if img.format not in self.config.VALID_CONTENT_TYPES:
                     raise ValidationError(
@@ -58,14 +92,6 @@ class BaseImageValidator(FileExtensionValidator):
                             'allowed': ', '.join(self.config.VALID_CONTENT_TYPES)
                         }
                     )
-                try:
-                    img.verify()
-                except Exception:
-                    pass  # Ignore verification errors for now
-            
-            # Second image opening: check dimensions
-            value.seek(0)  # Reset pointer again
-            with Image.open(value) as img:
                 width, height = img.size
                 if max(width, height) > self.config.MAX_DIMENSION:
                     raise ValidationError(
@@ -73,6 +99,10 @@ class BaseImageValidator(FileExtensionValidator):
                         code="oversized_image",
                         params={'dim': self.config.MAX_DIMENSION}
                     )
+                try:
+                    img.verify()
+                except Exception:
+                    pass  # Ignore verification errors for now
         except Exception as e:
             raise ValidationError(
                 _("Upload a valid image. The file you uploaded was either not an image or a corrupted image. Reason: %(reason)s"),
@@ -87,5 +117,5 @@ def secure_image_name(instance, filename: str, config_class) -> str:
     Generic secure filename generator.
     """
     ext = config_class.OUTPUT_EXTENSION
-    filename = f"{uuid.uuid4()}.{ext}"
+    filename = f"{uuid.uuid4().hex}.{ext}"
     return os.path.join(config_class.UPLOAD_PATH, filename)
\ No newline at end of file
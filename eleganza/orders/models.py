@@ -9,6 +9,7 @@ from django.urls import reverse
 from django.core.exceptions import ValidationError
 from eleganza.core.models import BaseModel, AuditLog
 from eleganza.users.models import User
+from eleganza.products.models import Inventory
 from djmoney.models.fields import MoneyField
 from djmoney.money import Money
 from djmoney.models.fields import CurrencyField
@@ -208,8 +209,9 @@ class Order(BaseModel):
                     raise InventoryShortageError(
                         f"Insufficient stock for {item.product.sku}"
                     )
-                inventory.stock_quantity -= item.quantity
-                inventory.save()
+                Inventory.objects.filter(pk=inventory.pk).update(
+                    stock_quantity=F('stock_quantity') - item.quantity
+                )
                 
             self.status = Order.Status.RESERVED
             self.save()
@@ -224,9 +226,9 @@ class Order(BaseModel):
             items = self.items.select_related('product__inventory').select_for_update()
             
             for item in items:
-                inventory = item.product.inventory
-                inventory.stock_quantity += item.quantity
-                inventory.save()
+                Inventory.objects.filter(pk=item.product_id).update(
+                    stock_quantity=F('stock_quantity') + item.quantity
+                )
                 
             self.status = Order.Status.CANCELLED
             self.save()
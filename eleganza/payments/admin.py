@@ -23,6 +23,7 @@ class WalletAdmin(admin.ModelAdmin):
     list_filter = ('currency',)
     search_fields = ('user__email', 'user__uuid')
     readonly_fields = ('user', 'currency')
+    list_select_related = ('user',)
     
     def user_email(self, obj):
         return obj.user.email
@@ -47,6 +48,7 @@ class PaymentMethodAdmin(admin.ModelAdmin):
     search_fields = ('user__email', 'cash_identifier')
     readonly_fields = ('cash_identifier',)
     raw_id_fields = ('user', 'wallet', 'cash_handled_by')
+    list_select_related = ('user', 'wallet', 'cash_handled_by')
     
     def user_email(self, obj):
         return obj.user.email
@@ -72,20 +74,21 @@ class TransactionAdmin(admin.ModelAdmin):
     search_fields = ('reference', 'order__id')
     readonly_fields = ('reference', 'created_at')
     raw_id_fields = ('payment_method', 'order', 'related_transaction')
+    list_select_related = ('payment_method__user',)
     
     def amount_with_currency(self, obj):
         return str(obj.amount)
     amount_with_currency.short_description = 'Amount'
     
     def payment_method_link(self, obj):
-        url = reverse('admin:payments_paymentmethod_change', args=[obj.payment_method.id])
+        url = reverse('admin:payments_paymentmethod_change', args=[obj.payment_method_id])
         return format_html('<a href="{}">{}</a>', url, obj.payment_method)
     payment_method_link.short_description = 'Payment Method'
     
     def order_link(self, obj):
-        if obj.order:
-            url = reverse('admin:orders_order_change', args=[obj.order.id])
-            return format_html('<a href="{}">Order #{}</a>', url, obj.order.id)
+        if obj.order_id:
+            url = reverse('admin:orders_order_change', args=[obj.order_id])
+            return format_html('<a href="{}">Order #{}</a>', url, obj.order_id)
         return '-'
     order_link.short_description = 'Order'
 
@@ -107,7 +110,7 @@ class PaymentAdmin(admin.ModelAdmin):
     amount_with_currency.short_description = 'Amount'
     
     def order_id(self, obj):
-        return f"Order #{obj.order.id}"
+        return f"Order #{obj.order_id}"
     order_id.short_description = 'Order'
     
     def process_payments(self, request, queryset):
@@ -128,6 +131,5 @@ class PaymentAdmin(admin.ModelAdmin):
     def get_queryset(self, request):
         return super().get_queryset(request).select_related(
             'method', 
-            'method__wallet', 
-            'order'
+            'method__wallet'
         )
\ No newline at end of file
@@ -0,0 +1,26 @@
+# Generated by Django 5.0.12 on 2026-10-17 09:10
+
+import django.db.models.deletion
+from django.contrib.postgres.operations import AddIndexConcurrently
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    atomic = False
+
+    dependencies = [
+        ('payments', '0002_initial'),
+    ]
+
+    operations = [
+        AddIndexConcurrently(
+            model_name='payment',
+            index=models.Index(fields=['order', 'status'], name='payment_order_status_idx'),
+        ),
+        migrations.AlterField(
+            model_name='payment',
+            name='order',
+            field=models.ForeignKey(db_index=False, on_delete=django.db.models.deletion.PROTECT, related_name='payments', to='orders.order'),
+        ),
+    ]
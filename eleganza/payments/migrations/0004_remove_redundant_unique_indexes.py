@@ -0,0 +1,30 @@
+# Generated by Django 5.0.12 on 2026-10-17 09:40
+
+import eleganza.payments.models
+from django.contrib.postgres.operations import RemoveIndexConcurrently
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    atomic = False
+
+    dependencies = [
+        ('payments', '0003_payment_payment_order_status_idx'),
+    ]
+
+    operations = [
+        RemoveIndexConcurrently(
+            model_name='paymentmethod',
+            name='payments_pa_cash_id_3279b6_idx',
+        ),
+        RemoveIndexConcurrently(
+            model_name='transaction',
+            name='payments_tr_referen_530efe_idx',
+        ),
+        migrations.AlterField(
+            model_name='paymentmethod',
+            name='cash_identifier',
+            field=models.CharField(default=eleganza.payments.models.generate_cash_id, editable=False, help_text='Automatically generated cash transaction reference', max_length=50, unique=True, verbose_name='Cash Transaction ID'),
+        ),
+    ]
@@ -94,8 +94,7 @@ class PaymentMethod(BaseModel):
         unique=True,
         editable=False,
         default=generate_cash_id,
-        help_text=_("Automatically generated cash transaction reference"),
-        db_index=True
+        help_text=_("Automatically generated cash transaction reference")
     )
     
     cash_handled_by = models.ForeignKey(
@@ -121,7 +120,6 @@ class PaymentMethod(BaseModel):
         ]
         indexes = [
             models.Index(fields=['method_type', 'user']),
-            models.Index(fields=['cash_identifier']),
             models.Index(fields=['cash_handled_by', 'created_at']),
         ]
 
@@ -186,7 +184,6 @@ class Transaction(BaseModel):
         ordering = ['-created_at']
         indexes = [
             models.Index(fields=['transaction_type', 'created_at']),
-            models.Index(fields=['reference']),
             models.Index(fields=['-created_at', 'payment_method']),
         ]
 
@@ -207,7 +204,8 @@ class Payment(BaseModel):
     order = models.ForeignKey(
         'orders.Order',
         on_delete=models.PROTECT,
-        related_name='payments'
+        related_name='payments',
+        db_index=False  # payment_order_status_idx leads with order
     )
     
     method = models.ForeignKey(
@@ -238,6 +236,7 @@ class Payment(BaseModel):
     class Meta:
         indexes = [
             models.Index(fields=['-created_at', 'status']),
+            models.Index(fields=['order', 'status'], name='payment_order_status_idx'),
         ]
 
     def clean(self):
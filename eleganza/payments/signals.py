@@ -11,12 +11,14 @@ logger = logging.getLogger(__name__)
 User = get_user_model()
 
 @receiver(post_save, sender=User)
-def create_user_payment_profile(sender, instance, created, **kwargs):
+def create_user_payment_profile(sender, instance, created, raw=False, **kwargs):
     """
     Creates payment profile for new users:
     - Wallet for all users
     - Default wallet payment method for customers
     """
+    if raw:
+        return  # Fixtures ship their own wallets and payment methods
     if created:
         try:
             with transaction.atomic():
@@ -108,6 +108,7 @@ class ProductReviewAdmin(admin.ModelAdmin):
     list_filter = ('rating', 'is_approved')
     search_fields = ('product__name', 'user__email', 'title')
     list_editable = ('is_approved',)
+    list_select_related = ('product', 'user')
     actions = ['approve_reviews']
 
     def rating_stars(self, obj):
@@ -119,7 +120,10 @@ class ProductReviewAdmin(admin.ModelAdmin):
 
     @admin.action(description=_("Approve selected reviews"))
     def approve_reviews(self, request, queryset):
-        queryset.update(is_approved=True)
-        for review in queryset:
-            review.product.update_rating_stats()
-        self.message_user(request, f"{queryset.count()} reviews approved")
\ No newline at end of file
+        # Read the products first: the changelist filter (e.g. "Approved: No")
+        # stops matching these rows once they are approved
+        product_ids = set(queryset.values_list('product_id', flat=True))
+        updated = queryset.update(is_approved=True)
+        # update() bypasses the post_save receiver, so refresh each product once
+        Product.recompute_rating_stats(product_ids)
+        self.message_user(request, f"{updated} reviews approved")
\ No newline at end of file
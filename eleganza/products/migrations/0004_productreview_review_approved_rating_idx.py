@@ -0,0 +1,20 @@
+# Generated by Django 5.0.12 on 2026-10-17 14:20
+
+from django.contrib.postgres.operations import AddIndexConcurrently
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    atomic = False
+
+    dependencies = [
+        ('products', '0003_product_is_active'),
+    ]
+
+    operations = [
+        AddIndexConcurrently(
+            model_name='productreview',
+            index=models.Index(condition=models.Q(('deleted_at__isnull', True), ('is_approved', True)), fields=['product', 'rating'], name='review_approved_rating_idx'),
+        ),
+    ]
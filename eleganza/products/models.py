@@ -8,7 +8,8 @@ from django.core.validators import (
 from django.core.exceptions import ValidationError
 from django.conf import settings
 from django.urls import reverse
-from django.db.models import Avg
+from django.db.models import Avg, Count, DecimalField, OuterRef, Subquery, Value
+from django.db.models.functions import Cast, Coalesce
 from eleganza.core.models import BaseModel
 from mptt.models import MPTTModel, TreeForeignKey
 from autoslug import AutoSlugField
@@ -203,14 +204,32 @@ class Product(BaseModel):
                    self.original_price.amount) * 100
         return round(discount, 2)
 
-    def update_rating_stats(self):
-        aggregates = self.reviews.filter(is_approved=True).aggregate(
-            average=Avg('rating'),
-            count=models.Count('id')
+    @classmethod
+    def recompute_rating_stats(cls, product_ids):
+        """Refresh rating stats for many products with a single UPDATE"""
+        approved = ProductReview.objects.filter(
+            product=OuterRef('pk'),
+            is_approved=True
+        ).order_by().values('product')
+        return cls.all_objects.filter(pk__in=product_ids).update(
+            average_rating=Coalesce(
+                Subquery(approved.annotate(
+                    average=Cast(Avg('rating'), DecimalField(max_digits=3, decimal_places=1))
+                ).values('average')),
+                Value(0, output_field=DecimalField(max_digits=3, decimal_places=1))
+            ),
+            review_count=Coalesce(
+                # rating is non-null and in review_approved_rating_idx, so
+                # counting it keeps this subquery index-only too
+                Subquery(approved.annotate(count=Count('rating')).values('count')),
+                Value(0)
+            )
         )
-        self.average_rating = aggregates['average'] or 0.0
-        self.review_count = aggregates['count']
-        self.save(update_fields=['average_rating', 'review_count'])
+
+    def update_rating_stats(self):
+        Product.recompute_rating_stats([self.pk])
+        # Reload so a later full save() doesn't write the old numbers back
+        self.refresh_from_db(fields=['average_rating', 'review_count'])
 
     def clean(self):
         if self.selling_price.currency != self.original_price.currency:
@@ -302,11 +321,6 @@ class ProductImage(BaseModel):
     def __str__(self):
         return _("Image for %(product)s") % {'product': self.product.name}
 
-    def save(self, *args, **kwargs):
-        if self.is_primary:
-            self.product.images.exclude(pk=self.pk).update(is_primary=False)
-        super().save(*args, **kwargs)
-
 class ProductReview(BaseModel):
     """Enhanced reviews with signals integration"""
     product = models.ForeignKey(
@@ -352,6 +366,11 @@ class ProductReview(BaseModel):
         indexes = [
             models.Index(fields=['rating']),
             models.Index(fields=['is_approved']),
+            # Serves recompute_rating_stats' per-product aggregate as an index-only scan
+            models.Index(
+                fields=['product', 'rating'],
+                name='review_approved_rating_idx',
+                condition=models.Q(is_approved=True, deleted_at__isnull=True)),
         ]
 
     def __str__(self):
@@ -360,12 +379,19 @@ class ProductReview(BaseModel):
             'product': self.product.name
         }
 
+    @classmethod
+    def bulk_create_with_recompute(cls, reviews, batch_size=500):
+        """Insert many reviews and refresh each touched product's stats once"""
+        reviews = cls.objects.bulk_create(reviews, batch_size=batch_size)
+        Product.recompute_rating_stats({review.product_id for review in reviews})
+        return reviews
+
     def clean(self):
         if self._state.adding and ProductReview.objects.filter(product=self.product, user=self.user).exists():
             raise ValidationError(_("You've already reviewed this product"))
         super().clean()
 
     def approve(self):
+        # The post_save receiver refreshes the product's rating stats
         self.is_approved = True
-        self.save()
-        self.product.update_rating_stats()
\ No newline at end of file
+        self.save()
\ No newline at end of file
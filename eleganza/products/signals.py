@@ -6,6 +6,7 @@ from django.db.models.signals import (
     pre_save
 )
 from django.dispatch import receiver
+from django.core.cache import cache
 from django.core.exceptions import ValidationError
 from .models import (
     Product,
@@ -13,6 +14,12 @@ from .models import (
     Inventory,
     ProductImage
 )
+from .tasks import (
+    RATING_RECOMPUTE_DELAY,
+    RATING_RECOMPUTE_MARGIN,
+    rating_recompute_key,
+    recompute_product_rating
+)
 
 logger = logging.getLogger(__name__)
 
@@ -21,20 +28,26 @@ def update_product_rating_stats(sender, instance, **kwargs):
     """
     Update product rating statistics when reviews change.
     Handles both creation/deletion and approval status changes.
-    Uses atomic transaction for data consistency.
+    Recomputation runs in Celery after commit; a cache slot per product
+    coalesces bursts of review changes into a single recompute.
     """
-    try:
-        with transaction.atomic():
-            logger.info(
-                f"Updating rating stats for product {instance.product_id}"
-            )
-            instance.product.update_rating_stats()
-    except Exception as e:
-        logger.error(
-            f"Failed updating rating stats for product {instance.product_id}: {str(e)}",
-            exc_info=True
+    product_id = instance.product_id
+
+    def _queue_recompute():
+        # The run is scheduled RATING_RECOMPUTE_MARGIN seconds after the slot
+        # lapses, so unless the web and worker clocks drift further apart than
+        # that, a change either lands before the run reads the reviews or
+        # finds the slot free and queues another
+        key = rating_recompute_key(product_id)
+        if not cache.add(key, 1, timeout=RATING_RECOMPUTE_DELAY):
+            return  # A recompute for this product is already queued
+        logger.info(f"Queueing rating stats update for product {product_id}")
+        recompute_product_rating.apply_async(
+            (product_id,),
+            countdown=RATING_RECOMPUTE_DELAY + RATING_RECOMPUTE_MARGIN
         )
-        raise
+
+    transaction.on_commit(_queue_recompute)
 
 @receiver(post_save, sender=Product)
 def create_inventory_for_new_product(sender, instance, created, **kwargs):
@@ -57,11 +70,18 @@ def create_inventory_for_new_product(sender, instance, created, **kwargs):
 def handle_primary_image_change(sender, instance, **kwargs):
     """
     Ensure only one primary image exists per product.
-    Automatically demotes previous primary image when new one is set.
+    Demotes the previous primary image only when this image becomes primary.
     """
-    if instance.is_primary:
-        # Update existing primary images atomically
-        ProductImage.objects.filter(
-            product=instance.product,
-            is_primary=True
-        ).exclude(pk=instance.pk).update(is_primary=False)
\ No newline at end of file
+    if not instance.is_primary:
+        return
+
+    # UUID pks are assigned before the first save, so check the state flag
+    if not instance._state.adding and ProductImage.objects.filter(
+        pk=instance.pk, is_primary=True
+    ).exists():
+        return  # Already the primary image; nothing to demote
+
+    ProductImage.objects.filter(
+        product_id=instance.product_id,
+        is_primary=True
+    ).exclude(pk=instance.pk).update(is_primary=False)
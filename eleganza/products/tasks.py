@@ -0,0 +1,17 @@
+from celery import shared_task
+
+from .models import Product
+
+RATING_RECOMPUTE_DELAY = 5  # seconds to coalesce bursts; also the debounce slot's TTL
+# Extra countdown past the slot's TTL, covering clock skew between web and worker hosts
+RATING_RECOMPUTE_MARGIN = 2
+
+
+def rating_recompute_key(product_id):
+    return f"products:rating-recompute:{product_id}"
+
+
+@shared_task()
+def recompute_product_rating(product_id):
+    """Refresh a product's rating stats once per burst of review changes."""
+    Product.recompute_rating_stats([product_id])
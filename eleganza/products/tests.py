@@ -1,3 +1,57 @@
-from django.test import TestCase
+from decimal import Decimal
 
-# Create your tests here.
+import pytest
+from djmoney.money import Money
+
+from eleganza.products.models import Product
+from eleganza.products.models import ProductReview
+from eleganza.users.models import User
+
+pytestmark = pytest.mark.django_db
+
+
+def make_product(sku):
+    return Product.objects.create(
+        name=f"Product {sku}",
+        sku=sku,
+        description="Test product",
+        original_price=Money(100, "LYD"),
+        selling_price=Money(80, "LYD"),
+    )
+
+
+def make_review(product, username, rating, *, is_approved=True):
+    user = User.objects.create_user(username, f"{username}@example.com", "review-Pass-1")
+    return ProductReview.objects.create(
+        product=product,
+        user=user,
+        rating=rating,
+        title="Review",
+        comment="Comment",
+        is_approved=is_approved,
+    )
+
+
+def test_recompute_rating_stats_counts_live_approved_reviews():
+    product = make_product("SKU-RATED")
+    make_review(product, "first", 4)
+    make_review(product, "second", 5)
+    make_review(product, "pending", 1, is_approved=False)
+    make_review(product, "removed", 1).delete()  # Soft delete
+
+    assert Product.recompute_rating_stats([product.pk]) == 1
+
+    product.refresh_from_db()
+    assert product.average_rating == Decimal("4.5")
+    assert product.review_count == 2
+
+
+def test_recompute_rating_stats_resets_products_without_reviews():
+    product = make_product("SKU-EMPTY")
+    Product.objects.filter(pk=product.pk).update(average_rating=Decimal("3.0"), review_count=7)
+
+    Product.recompute_rating_stats([product.pk])
+
+    product.refresh_from_db()
+    assert product.average_rating == Decimal("0.0")
+    assert product.review_count == 0
@@ -0,0 +1,27 @@
+# Generated by Django 5.0.12 on 2026-10-17 09:00
+
+import django.db.models.deletion
+from django.conf import settings
+from django.contrib.postgres.operations import AddIndexConcurrently
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    atomic = False
+
+    dependencies = [
+        ('users', '0001_initial'),
+    ]
+
+    operations = [
+        AddIndexConcurrently(
+            model_name='passwordhistory',
+            index=models.Index(fields=['user', '-created_at'], name='pwhist_user_created_idx'),
+        ),
+        migrations.AlterField(
+            model_name='passwordhistory',
+            name='user',
+            field=models.ForeignKey(db_index=False, on_delete=django.db.models.deletion.CASCADE, related_name='password_history', to=settings.AUTH_USER_MODEL),
+        ),
+    ]
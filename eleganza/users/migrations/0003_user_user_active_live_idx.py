@@ -0,0 +1,20 @@
+# Generated by Django 5.0.12 on 2026-10-17 09:20
+
+from django.contrib.postgres.operations import AddIndexConcurrently
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    atomic = False
+
+    dependencies = [
+        ('users', '0002_passwordhistory_pwhist_user_created_idx'),
+    ]
+
+    operations = [
+        AddIndexConcurrently(
+            model_name='user',
+            index=models.Index(condition=models.Q(('deleted_at__isnull', True)), fields=['is_active'], name='user_active_live_idx'),
+        ),
+    ]
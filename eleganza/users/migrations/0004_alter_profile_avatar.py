@@ -0,0 +1,24 @@
+# Generated by Django 5.0.12 on 2026-10-17 10:30
+
+import eleganza.users.validators
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('users', '0003_user_user_active_live_idx'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='customerprofile',
+            name='avatar',
+            field=models.ImageField(blank=True, help_text='User profile image (WEBP format)', null=True, upload_to=eleganza.users.validators.avatar_path, validators=[eleganza.users.validators.AvatarValidator()], verbose_name='Avatar'),
+        ),
+        migrations.AlterField(
+            model_name='teammemberprofile',
+            name='avatar',
+            field=models.ImageField(blank=True, help_text='User profile image (WEBP format)', null=True, upload_to=eleganza.users.validators.avatar_path, validators=[eleganza.users.validators.AvatarValidator()], verbose_name='Avatar'),
+        ),
+    ]
@@ -1,28 +1,49 @@
+import os
+import re
 import uuid
-from django.db import models
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from django.db import IntegrityError, models, transaction
 from django.conf import settings
 from django.contrib.auth.models import AbstractUser, BaseUserManager
 from django.utils.translation import gettext_lazy as _
-from django.core.validators import validate_email
 from django.core.exceptions import ValidationError
 from django.contrib.auth.hashers import check_password
 from django_countries.fields import CountryField
 from phonenumber_field.modelfields import PhoneNumberField
 from timezone_field import TimeZoneField
-from imagekit.models import ProcessedImageField
-from imagekit.processors import ResizeToFill
-from eleganza.core.models import SoftDeleteModel, TimeStampedModel
+from eleganza.core.models import SoftDeleteModel, SoftDeleteQuerySet, TimeStampedModel
 from .validators import AvatarValidator, avatar_path
 from django.contrib.auth.validators import UnicodeUsernameValidator
 
+PASSWORD_HISTORY_LIMIT = getattr(settings, 'PASSWORD_HISTORY_LIMIT', 5)
+USERNAME_RE = re.compile(r'^[\w.@+ -]+\Z')
+
 class SpaceAllowedUsernameValidator(UnicodeUsernameValidator):
-    regex = r'^[\w.@+ -]+\Z'
+    regex = USERNAME_RE
     message = _(
         "Enter a valid username. This value may contain letters, digits, "
         "@/./+/-/_ characters, and spaces."
     )
 
-class UserManager(BaseUserManager):
+class UserQuerySet(models.QuerySet):
+    """User queryset with soft-delete filters and a lightweight auth helper"""
+
+    AUTH_FIELDS = (
+        'id', 'uuid', 'username', 'email', 'password', 'type',
+        'is_active', 'is_staff', 'is_superuser', 'last_login',
+    )
+
+    # Borrow the filters only: SoftDeleteQuerySet.delete() would turn bulk
+    # user deletes (e.g. the admin action) into soft deletes
+    alive = SoftDeleteQuerySet.alive
+    dead = SoftDeleteQuerySet.dead
+
+    def for_auth(self):
+        """Load only the columns needed for authentication checks"""
+        return self.only(*self.AUTH_FIELDS)
+
+class UserManager(BaseUserManager.from_queryset(UserQuerySet)):
     """Enhanced user manager with complete validation chain"""
     
     def _validate_creation_fields(self, username, email):
@@ -32,8 +53,12 @@ class UserManager(BaseUserManager):
         if not username:
             raise ValueError(_('The Username must be set'))
 
-    def create_user(self, username, email, password=None, **extra_fields):
-        """Create user with full validation pipeline"""
+    def get_by_natural_key(self, username):
+        """Authentication lookup; loads only the columns login needs"""
+        return self.for_auth().get(**{self.model.USERNAME_FIELD: username})
+
+    def create_user(self, username, email, password=None, validate=True, **extra_fields):
+        """Create user with full validation pipeline (skippable for trusted callers)"""
         self._validate_creation_fields(username, email)
         
         user = self.model(
@@ -42,8 +67,17 @@ class UserManager(BaseUserManager):
             **extra_fields
         )
         user.set_password(password)
-        user.full_clean()
-        user.save(using=self._db)
+        if validate:
+            # Uniqueness is left to the database constraints instead of a SELECT per unique field
+            user.full_clean(validate_unique=False, validate_constraints=False)
+        try:
+            with transaction.atomic(using=self._db):
+                user.save(using=self._db)
+        except IntegrityError:
+            # The save also runs the profile/wallet receivers, so only report
+            # a duplicate when one exists; validate_unique raises per-field errors
+            user.validate_unique()
+            raise
         return user
 
     def create_superuser(self, username, email, password=None, **extra_fields):
@@ -109,22 +143,36 @@ class User(AbstractUser, SoftDeleteModel, TimeStampedModel):
                 name='unique_non_empty_username',
                 condition=models.Q(username__isnull=False)),
         ]
+        indexes = [
+            models.Index(
+                fields=['is_active'],
+                name='user_active_live_idx',
+                condition=models.Q(deleted_at__isnull=True)),
+        ]
         
     def set_password(self, raw_password):
         """Override password setting with history validation"""
         if self.pk:  # Only check history for existing users
-            max_history = getattr(settings, 'PASSWORD_HISTORY_LIMIT', 5)
-            
             # Prevent reusing current password
             if self.check_password(raw_password):
                 raise ValidationError(_("New password must differ from current password."))
             
             # Check against password history
-            last_passwords = self.password_history.order_by('-created_at')[:max_history]
-            for entry in last_passwords:
-                if check_password(raw_password, entry.password):
+            last_passwords = [
+                hashed for hashed in self.password_history.order_by('-created_at')
+                .values_list('password', flat=True)[:PASSWORD_HISTORY_LIMIT]
+                # The current hash was verified above, so don't verify it again
+                if hashed != self.password
+            ]
+            # The hashers release the GIL, so verifying the entries
+            # concurrently bounds the wall-clock cost
+            if last_passwords:
+                workers = min(len(last_passwords), os.cpu_count() or 1)
+                with ThreadPoolExecutor(max_workers=workers) as pool:
+                    reused = any(pool.map(partial(check_password, raw_password), last_passwords))
+                if reused:
                     raise ValidationError(
-                        _("Cannot reuse any of your last %(count)d passwords.") % {'count': max_history}
+                        _("Cannot reuse any of your last %(count)d passwords.") % {'count': PASSWORD_HISTORY_LIMIT}
                     )
         
         super().set_password(raw_password)
@@ -134,16 +182,23 @@ class User(AbstractUser, SoftDeleteModel, TimeStampedModel):
         creating = self.pk is None
         super().save(*args, **kwargs)
         
-        # For new users, create initial password history entry
+        # For new users, create initial password history entry once the user
+        # row is committed; a fresh history cannot exceed the limit, so skip
+        # the trim round trips
         if creating:
-            PasswordHistory.objects.create(
-                user=self,
-                password=self.password
-            )
+            entry = PasswordHistory(user=self, password=self.password)
+            transaction.on_commit(partial(PasswordHistory.objects.bulk_create, [entry]))
+
+    def normalize_identifiers(self):
+        """Strip and lowercase email and username so lookups match case-insensitively"""
+        if self.email:
+            self.email = self.email.strip().lower()
+        if self.username:
+            self.username = self.username.strip().lower()
 
     def clean(self):
+        # EmailField already runs validate_email in clean_fields
         super().clean()
-        validate_email(self.email)
 
     def __str__(self):
         return f"{self.username} ({self.uuid})"
@@ -179,12 +234,9 @@ class UserProfile(models.Model):
         help_text=_("Interface language preference")
     )
     
-    avatar = ProcessedImageField(
+    avatar = models.ImageField(
         verbose_name=_("Avatar"),
         upload_to=avatar_path,
-        processors=[ResizeToFill(400, 400)],
-        format='WEBP',
-        options={'quality': 85},
         validators=[AvatarValidator()],
         blank=True,
         null=True,
@@ -311,13 +363,25 @@ class Address(models.Model):
     def __str__(self):
         return f"{self.city}, {self.country.name}"
 
+class PasswordHistoryManager(models.Manager):
+    """Keeps each user's history as a bounded ring buffer"""
+
+    def record(self, user, password):
+        """Append a hash and evict entries beyond PASSWORD_HISTORY_LIMIT"""
+        with transaction.atomic():
+            entry = self.create(user=user, password=password)
+            newest = self.filter(user=user).order_by('-created_at').values_list('pk', flat=True)[:PASSWORD_HISTORY_LIMIT]
+            self.filter(user=user).exclude(pk__in=newest).delete()
+        return entry
+
 class PasswordHistory(models.Model):
     """Security audit trail for credential changes"""
     
     user = models.ForeignKey(
         User,
         on_delete=models.CASCADE,
-        related_name='password_history'
+        related_name='password_history',
+        db_index=False  # pwhist_user_created_idx leads with user
     )
     
     password = models.CharField(
@@ -331,10 +395,15 @@ class PasswordHistory(models.Model):
         db_index=True
     )
 
+    objects = PasswordHistoryManager()
+
     class Meta:
         verbose_name = _("Password History")
         verbose_name_plural = _("Password Histories")
         ordering = ['-created_at']
+        indexes = [
+            models.Index(fields=['user', '-created_at'], name='pwhist_user_created_idx'),
+        ]
 
     def __str__(self):
         return f"Auth Record #{self.pk}"
\ No newline at end of file
@@ -1,102 +1,113 @@
 # signals.py
 import logging
+from functools import partial
 from django.db import models, transaction
 from django.db.models.signals import post_save, pre_save, pre_delete
 from django.dispatch import receiver
 from django.contrib.auth import get_user_model
-from django.conf import settings
 from allauth.account.models import EmailAddress
 from .models import CustomerProfile, TeamMemberProfile, PasswordHistory
+from .tasks import convert_avatar_to_webp
 
 logger = logging.getLogger(__name__)
 User = get_user_model()
 
+PROFILE_MODELS = {
+    User.Types.CUSTOMER: CustomerProfile,
+    User.Types.TEAM_MEMBER: TeamMemberProfile,
+}
+
 @receiver(post_save, sender=User)
-def create_user_profile(sender, instance, created, **kwargs):
+def create_user_profile(sender, instance, created, raw=False, **kwargs):
     """Atomic profile creation with type validation"""
-    if created:
+    if created and not raw:  # Fixtures ship their own profiles
         try:
             with transaction.atomic():
-                # Verify final user type after full creation
-                user = User.objects.get(pk=instance.pk)
-                if user.type == User.Types.CUSTOMER:
-                    CustomerProfile.objects.create(user=user)
-                elif user.type == User.Types.TEAM_MEMBER:
-                    TeamMemberProfile.objects.create(user=user)
-                logger.info(f"Created {user.type} profile for {user.uuid}")
-        except User.DoesNotExist:
-            logger.error("User vanished before profile creation")
+                # The saved instance already carries the final user type
+                profile_model = PROFILE_MODELS.get(instance.type)
+                if profile_model is not None:
+                    profile_model.objects.create(user=instance)
+                logger.info(f"Created {instance.type} profile for {instance.uuid}")
         except Exception as e:
             logger.error(f"Critical profile failure: {str(e)}")
             raise  # Preserve transaction integrity
 
 @receiver(pre_save, sender=User)
-def track_password_changes(sender, instance, **kwargs):
+def load_original_user(sender, instance, raw=False, update_fields=None, **kwargs):
+    """Fetch the stored row once and share it with the pre_save receivers below"""
+    instance._original = None
+    if raw:
+        return  # Fixture loads store rows as-is
+    if update_fields is not None and not {'password', 'email', 'username'} & set(update_fields):
+        return  # Nothing the receivers below compare is being written
+    if instance.pk and not instance._state.adding:
+        instance._original = User.all_objects.filter(pk=instance.pk).only(
+            'password', 'email', 'username'
+        ).first()
+
+@receiver(pre_save, sender=User)
+def track_password_changes(sender, instance, raw=False, update_fields=None, **kwargs):
     """Atomic password history tracking with configurable limit"""
-    if not instance.pk or instance._state.adding:
+    if raw or not instance.pk or instance._state.adding:
+        return
+    if update_fields is not None and 'password' not in update_fields:
         return
 
-    try:
-        with transaction.atomic():
-            original = User.objects.get(pk=instance.pk)
-            if instance.password != original.password:
-                # Record old password before change
-                PasswordHistory.objects.create(
-                    user=instance,
-                    password=original.password
-                )
-                
-                # Trim history using settings configuration
-                max_history = getattr(settings, 'PASSWORD_HISTORY_LIMIT', 5)
-                user_history = PasswordHistory.objects.filter(user=instance)
-                
-                # Calculate and remove excess entries
-                if user_history.count() > max_history:
-                    entries_to_remove = user_history.count() - max_history
-                    old_entries = user_history.order_by('created_at')[:entries_to_remove]
-                    PasswordHistory.objects.filter(pk__in=old_entries.values_list('id', flat=True)).delete()
-                    
-                logger.debug(f"Updated password history for {instance.uuid}")
-    except User.DoesNotExist:
+    original = instance._original
+    if original is None:
         logger.warning(f"Password tracking failed for {instance.uuid}")
+        return
+
+    try:
+        if instance.password != original.password:
+            # Record old password once the change commits; trims to the configured depth
+            transaction.on_commit(
+                partial(PasswordHistory.objects.record, instance, original.password)
+            )
+            logger.debug(f"Updated password history for {instance.uuid}")
     except Exception as e:
         logger.error(f"Password history update error: {str(e)}")
         raise
 
 @receiver(pre_save, sender=User)
-def normalize_user_identifiers(sender, instance, **kwargs):
+def normalize_user_identifiers(sender, instance, raw=False, update_fields=None, **kwargs):
     """Consistent identifier normalization"""
-    if instance.email:
-        instance.email = instance.email.strip().lower()
-    if instance.username:
-        instance.username = instance.username.strip().lower()
+    if raw:
+        return
+    # Partial saves that don't write identifiers (e.g. last_login) have nothing to sync
+    if update_fields is not None and not {'email', 'username'} & set(update_fields):
+        return
+
+    instance.normalize_identifiers()
     
-    # Sync allauth emails for existing users
-    if instance.pk and EmailAddress.objects.filter(user=instance).exists():
+    # Sync allauth emails for existing users whose address actually changed
+    original = instance._original
+    if instance.pk and (original is None or original.email != instance.email):
         EmailAddress.objects.filter(user=instance).update(email=instance.email)
 
 @receiver(post_save, sender=User)
-def handle_soft_delete(sender, instance, created, **kwargs):
+def handle_soft_delete(sender, instance, created, raw=False, **kwargs):
     """GDPR-compliant soft delete handling"""
-    if not created and not instance.is_active:
+    if not created and not raw and not instance.is_active:
         try:
             with transaction.atomic():
                 # Anonymize core fields
-                update_fields = []
-                if instance.first_name != "Deleted":
-                    instance.first_name = "Deleted"
-                    update_fields.append('first_name')
-                if instance.last_name != "User":
-                    instance.last_name = "User"
-                    update_fields.append('last_name')
-                
-                new_email = f"deleted_{instance.uuid}@example.invalid"
-                if instance.email != new_email:
-                    instance.email = new_email
-                    update_fields.append('email')
+                anonymized = {
+                    'first_name': "Deleted",
+                    'last_name': "User",
+                    'email': f"deleted_{instance.uuid}@example.invalid",
+                }
+                changes = {
+                    field: value for field, value in anonymized.items()
+                    if getattr(instance, field) != value
+                }
 
-                if update_fields:
-                    instance.save(update_fields=update_fields)
+                if changes:
+                    # Queryset update skips re-running the pre_save receivers
+                    # on values that are already normalized
+                    for field, value in changes.items():
+                        setattr(instance, field, value)
+                    User.all_objects.filter(pk=instance.pk).update(**changes)
                 
                 # Cleanup allauth associations
                 EmailAddress.objects.filter(user=instance).delete()
@@ -112,4 +123,21 @@ def handle_hard_delete(sender, instance, **kwargs):
         EmailAddress.objects.filter(user=instance).delete()
         logger.info(f"Hard delete cleanup for {instance.uuid}")
     except Exception as e:
-        logger.error(f"Hard delete cleanup failed for {instance.uuid}: {str(e)}")
\ No newline at end of file
+        logger.error(f"Hard delete cleanup failed for {instance.uuid}: {str(e)}")
+
+@receiver(pre_save, sender=CustomerProfile)
+@receiver(pre_save, sender=TeamMemberProfile)
+def flag_avatar_upload(sender, instance, raw=False, **kwargs):
+    """Remember whether this save carries a new avatar upload"""
+    avatar = instance.avatar
+    instance._avatar_uploaded = bool(not raw and avatar and not avatar._committed)
+
+@receiver(post_save, sender=CustomerProfile)
+@receiver(post_save, sender=TeamMemberProfile)
+def queue_avatar_conversion(sender, instance, **kwargs):
+    """Re-encode new avatar uploads off the request path"""
+    if getattr(instance, '_avatar_uploaded', False):
+        instance._avatar_uploaded = False
+        transaction.on_commit(
+            partial(convert_avatar_to_webp.delay, instance._meta.label, instance.pk)
+        )
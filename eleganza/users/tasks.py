@@ -1,9 +1,74 @@
+import logging
+import math
+from io import BytesIO
+
 from celery import shared_task
+from django.apps import apps
+from django.core.files import File
+
+from .models import User
+from .validators import AvatarConfig
 
-from .model import User
+logger = logging.getLogger(__name__)
 
 
 @shared_task()
 def get_users_count():
     """A pointless Celery task to demonstrate usage."""
     return User.objects.count()
+
+
+@shared_task(autoretry_for=(OSError,), retry_backoff=True, max_retries=3)
+def convert_avatar_to_webp(model_label, profile_pk):
+    """Crop and encode a stored avatar upload to a fixed-size WebP."""
+    # Imported here so workers that never process avatars don't load Pillow
+    from PIL import Image
+    from PIL import ImageOps
+    from PIL import UnidentifiedImageError
+
+    model = apps.get_model(model_label)
+    profile = model.objects.filter(pk=profile_pk).first()
+    if profile is None or not profile.avatar:
+        return
+
+    avatar = profile.avatar
+    original_name = avatar.name
+    with avatar.open("rb"):
+        try:
+            img = Image.open(avatar)
+        except UnidentifiedImageError:
+            # An OSError subclass, but retrying won't make the file decodable
+            logger.warning(f"Avatar {original_name} for {model_label} {profile_pk} is not a readable image")
+            return
+        with img:
+            # Image.open only parses the header; an upload that is already a WebP
+            # of the stored size needs no decode or re-encode
+            if img.format == "WEBP" and img.size == AvatarConfig.OUTPUT_SIZE:
+                return
+            # Resolve palettes before resizing: Pillow falls back to NEAREST for
+            # P and 1 mode images. RGB JPEGs skip this and keep draft decoding
+            if img.mode not in ("RGB", "RGBA"):
+                img = img.convert("RGBA" if img.has_transparency_data else "RGB")
+            # Shrink until the short side just covers the output box before the
+            # exact crop; reducing_gap box-reduces (and lets JPEGs decode at a
+            # reduced scale) so Lanczos only runs on a small image
+            scale = max(AvatarConfig.OUTPUT_SIZE) / min(img.size)
+            if scale < 1:
+                cover = (math.ceil(img.width * scale), math.ceil(img.height * scale))
+                img.thumbnail(cover, Image.Resampling.LANCZOS, reducing_gap=2.0)
+            img = ImageOps.exif_transpose(img)
+            img = ImageOps.fit(img, AvatarConfig.OUTPUT_SIZE, Image.Resampling.LANCZOS)
+            buffer = BytesIO()
+            img.save(buffer, "WEBP", quality=AvatarConfig.QUALITY, method=AvatarConfig.WEBP_METHOD)
+
+    # upload_to assigns the final .webp name, so the original name is only a hint.
+    # Hand the buffer to storage as-is rather than copying it out with getvalue()
+    avatar.save(original_name, File(buffer), save=False)
+    # A queryset update keeps the profile signals from seeing this as a new upload.
+    # Only swap if the row still holds the file we converted: a newer upload
+    # landing meanwhile wins and gets its own conversion
+    updated = model.objects.filter(pk=profile_pk, avatar=original_name).update(avatar=avatar.name)
+    if not updated:
+        avatar.storage.delete(avatar.name)
+        return
+    avatar.storage.delete(original_name)
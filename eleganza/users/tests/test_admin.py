@@ -9,7 +9,7 @@ from django.contrib.auth.models import AnonymousUser
 from django.urls import reverse
 from pytest_django.asserts import assertRedirects
 
-from eleganza.users.model import User
+from eleganza.users.models import User
 
 
 class TestUserAdmin:
@@ -4,7 +4,7 @@
 from django.utils.translation import gettext_lazy as _
 
 from eleganza.users.forms import UserAdminCreationForm
-from eleganza.users.model import User
+from eleganza.users.models import User
 
 
 class TestUserAdminCreationForm:
@@ -1,5 +1,34 @@
-from eleganza.users.model import User
+import pytest
+from django.contrib.auth.hashers import make_password
+from django.core.exceptions import ValidationError
+
+from eleganza.users.models import PASSWORD_HISTORY_LIMIT
+from eleganza.users.models import PasswordHistory
+from eleganza.users.models import User
 
 
 def test_user_get_absolute_url(user: User):
     assert user.get_absolute_url() == f"/users/{user.username}/"
+
+
+@pytest.fixture
+def history_user(db) -> User:
+    return User.objects.create_user("history", "history@example.com", "initial-Pass-1")
+
+
+def test_password_history_keeps_newest_entries(history_user: User):
+    total = PASSWORD_HISTORY_LIMIT + 2
+    for i in range(total):
+        PasswordHistory.objects.record(history_user, f"hash-{i}")
+
+    kept = list(history_user.password_history.values_list("password", flat=True))
+    assert kept == [f"hash-{i}" for i in reversed(range(total - PASSWORD_HISTORY_LIMIT, total))]
+
+
+def test_set_password_rejects_recorded_password(history_user: User):
+    PasswordHistory.objects.record(history_user, make_password("previous-Pass-2"))
+
+    with pytest.raises(ValidationError):
+        history_user.set_password("previous-Pass-2")
+    history_user.set_password("brand-new-Pass-3")
+    assert history_user.check_password("brand-new-Pass-3")
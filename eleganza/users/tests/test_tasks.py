@@ -1,8 +1,17 @@
+from io import BytesIO
+
 import pytest
 from celery.result import EagerResult
+from django.core.files.base import ContentFile
+from django.core.files.storage import default_storage
+from PIL import Image
 
+from eleganza.users.models import CustomerProfile
+from eleganza.users.models import User
+from eleganza.users.tasks import convert_avatar_to_webp
 from eleganza.users.tasks import get_users_count
 from eleganza.users.tests.factories import UserFactory
+from eleganza.users.validators import AvatarConfig
 
 pytestmark = pytest.mark.django_db
 
@@ -15,3 +24,40 @@ def test_user_count(settings):
     task_result = get_users_count.delay()
     assert isinstance(task_result, EagerResult)
     assert task_result.result == batch_size
+
+
+@pytest.fixture
+def customer_profile():
+    user = User.objects.create_user("avatar", "avatar@example.com", "avatar-Pass-1")
+    return user.customerprofile_profile
+
+
+def store_avatar(profile, name, content):
+    stored = default_storage.save(name, ContentFile(content))
+    CustomerProfile.objects.filter(pk=profile.pk).update(avatar=stored)
+    return stored
+
+
+def test_convert_avatar_to_webp_resizes_palette_upload(customer_profile):
+    buffer = BytesIO()
+    Image.new("P", (800, 600), color=3).save(buffer, "PNG")
+    original = store_avatar(customer_profile, "avatars/upload.png", buffer.getvalue())
+
+    convert_avatar_to_webp(CustomerProfile._meta.label, customer_profile.pk)
+
+    customer_profile.refresh_from_db()
+    assert customer_profile.avatar.name.endswith(".webp")
+    with customer_profile.avatar.open("rb"), Image.open(customer_profile.avatar) as img:
+        assert img.format == "WEBP"
+        assert img.size == AvatarConfig.OUTPUT_SIZE
+    assert not default_storage.exists(original)
+
+
+def test_convert_avatar_to_webp_leaves_unreadable_upload(customer_profile):
+    original = store_avatar(customer_profile, "avatars/broken.png", b"not an image")
+
+    convert_avatar_to_webp(CustomerProfile._meta.label, customer_profile.pk)
+
+    customer_profile.refresh_from_db()
+    assert customer_profile.avatar.name == original
+    assert default_storage.exists(original)
@@ -1,5 +1,6 @@
 # ruff: noqa
 import os
+import shutil
 from collections.abc import Sequence
 from pathlib import Path
 
@@ -16,11 +17,11 @@ def merge(
     output_file: Path,
     files_to_merge: Sequence[Path],
 ) -> None:
-    merged_content = ""
-    for merge_file in files_to_merge:
-        merged_content += merge_file.read_text()
-        merged_content += os.linesep
-    output_file.write_text(merged_content)
+    with output_file.open("wb") as output:
+        for merge_file in files_to_merge:
+            with merge_file.open("rb") as source:
+                shutil.copyfileobj(source, output)
+            output.write(os.linesep.encode())
 
 
 if __name__ == "__main__":